@@ -1,9 +1,17 @@
 from dataclasses import dataclass
+import os
 import uuid
 import json
+import orjson
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain, islice
 from jira import JIRA
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from getpass import getpass
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
@@ -23,18 +31,154 @@ def google_slides_connect():
     
     return build('slides', 'v1', credentials=credentials)
 
-def updateSlides(service, **kwargs):
-    '''General function for pushing updates to a specific slide deck'''
-    return service.presentations().batchUpdate(**kwargs).execute()
+def updateSlides(service, body, **kwargs):
+    '''General function for pushing updates to a specific slide deck
 
-@dataclass
+    The body is serialized with orjson rather than left to the client's json encoder, 
+    which is slow for large lists of requests.
+    '''
+
+    request = service.presentations().batchUpdate(**kwargs)
+
+    request.body = orjson.dumps(body)
+    request.body_size = len(request.body)
+    request.headers['content-type'] = 'application/json'
+
+    return request.execute()
+
+# order the different kinds of requests are sent to Google Slides in. Each kind
+# only depends on the kinds before it (e.g. text styles need the text inserted)
+SLIDE_REQUEST_ORDER = {
+    'createSlide': 0,
+    'createShape': 1,
+    'createLine': 1,
+    'insertText': 2,
+    'updateShapeProperties': 3,
+    'updateLineProperties': 3,
+    'updateParagraphStyle': 4,
+    'updateTextStyle': 4,
+}
+
+def sort_slide_reqs(requests):
+    '''Groups the requests by kind so all of the shapes are created first, then all of the 
+    text inserted, then all of the styling applied
+
+    The sort is stable so the requests for a single object keep their relative order (e.g. the 
+    text style for the whole shape is applied before the bold tagline range).
+
+    Args: 
+        requests (list(dict)): request bodies to sort
+
+    Returns: 
+        (list(dict)): sorted request bodies
+    '''
+
+    return sorted(requests, key=lambda request: SLIDE_REQUEST_ORDER[next(iter(request))])
+
+def batched_update(service, presentation_id, requests, chunk=500):
+    '''Pushes the requests to a slide deck in batches of at most chunk requests
+
+    The requests are consumed lazily, each batch is sent as soon as it fills so only one batch 
+    is held in memory at a time. The batches are sent one after the other in order, so a request 
+    can still depend on objects created by a request in an earlier batch. Within a batch the 
+    requests are grouped by kind with sort_slide_reqs.
+
+    Args: 
+        service (googleapiclient.discovery.Resource): google authenticated service to use when updating slides
+        presentation_id (str): google id of presentation to update
+        requests (iterable(dict)): request bodies to send
+        chunk (int): maximum number of requests sent in a single batch
+
+    Returns: 
+        (list(dict)): responses for each batch
+    '''
+
+    requests = iter(requests)
+    responses = []
+
+    while batch := list(islice(requests, chunk)):
+
+        responses.append(updateSlides(
+            service = service,
+            presentationId = presentation_id,
+            body = {'requests': sort_slide_reqs(batch)}
+        ))
+
+    return responses
+
+def pool_jira_connections(jira_service, pool_size=16):
+    '''Mounts a connection pool on the jira session so concurrent requests reuse open connections
+
+    Args: 
+        jira_service (JIRA): authenticated service used for interacting with jira
+        pool_size (int): number of connections kept open to the jira server
+    '''
+
+    jira_service._session.mount(
+        jira_service.server_url,
+        HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+    )
+
+def parallel_search(jira_service, jql, fields, page=100, workers=8):
+    '''Retrieves all of the issues matching a JQL filter, fetching the pages concurrently
+
+    Args: 
+        jira_service (JIRA): authenticated service used for interacting with jira
+        jql (str): JQL filter to search with
+        fields (str): comma separated list of the fields to include on each issue
+        page (int): number of issues requested per page
+        workers (int): maximum number of pages fetched at the same time
+
+    Returns: 
+        (list(Issue)): issues in the order returned by jira
+    '''
+
+    first_page = jira_service.search_issues(
+        jql_str=jql,
+        startAt=0,
+        maxResults=page,
+        fields=fields,
+        json_result=False
+    )
+
+    # servers cap the page size (e.g. 100 on Jira Cloud), so step through the
+    # remaining pages using the size that was actually returned
+    page = first_page.maxResults or page
+
+    issues = list(first_page)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+
+        futures = [
+            pool.submit(
+                jira_service.search_issues,
+                jql_str=jql,
+                startAt=start_at,
+                maxResults=page,
+                fields=fields,
+                json_result=False
+            )
+            for start_at in range(page, first_page.total, page)
+        ]
+
+        for future in futures:
+
+            issues.extend(future.result())
+
+    return issues
+
+@dataclass(slots=True)
 class JiraRoadmapIssue:
     jira_id:str
     product_categories:list
     jira_quarter:str
     jira_link:str
     summary:str = ''
-    description:str = '',
+    description:str = ''
     beta:bool = False
 
 def get_roadmap_issues(
@@ -44,7 +188,8 @@ def get_roadmap_issues(
         product_category_mode, 
         product_category_prefix, 
         include_beta, 
-        beta_attribute_name
+        beta_attribute_name,
+        batch_size=500
     ):
     '''Retrieves all of the Roadmap Initiatives in Jira Cloud
 
@@ -54,23 +199,53 @@ def get_roadmap_issues(
         issue_type (str): name of the type of issues that represent roadmap items
         product_category_mode (str): 'components' or 'labels' 
         include_beta (bool): whether beta roadmap items are included
-        beta_attribute_name (str): name of the attribute where the beta flag is held in jira
+        beta_attribute_name (str): name or id of the attribute where the beta flag is held in jira
+        batch_size (int): number of issues requested per page when paging through the search results
     '''
     
+    pool_jira_connections(jira_service)
+
     jql_filter = f'project = {jira_project} and issuetype = "{issue_type}"'
 
-    roadmap_issue_ids = jira_service.search_issues(
-        jql_str=jql_filter,
-        maxResults=None
+    # resolve a field name (e.g. "Stage") to its id (e.g. "customfield_10933") once,
+    # the issues returned by the search only have their fields keyed by id
+    if beta_attribute_name.startswith('customfield_'):
+
+        beta_field_id = beta_attribute_name
+
+    else:
+
+        field_ids = {field['name']: field['id'] for field in jira_service.fields()}
+        beta_field_id = field_ids.get(beta_attribute_name, beta_attribute_name)
+
+    # only request the fields that are used below so each issue comes back
+    # fully populated from the search and doesn't need to be fetched again
+    roadmap_issue_fields = ['summary', 'description', 'components', 'labels', 'status', beta_field_id]
+
+    roadmap_issue_ids = parallel_search(
+        jira_service=jira_service,
+        jql=jql_filter,
+        fields=','.join(roadmap_issue_fields),
+        page=batch_size
     )
 
     if roadmap_issue_ids:
         
         roadmap_issues = []
+
+        # same url issue.permalink() builds, without the per issue method call
+        browse_url = f'{jira_service.server_url}/browse/'
         
-        for issue_id in roadmap_issue_ids: 
+        for issue in roadmap_issue_ids: 
+
+            # check the beta flag first so excluded issues are skipped before doing any other work
+            beta_attr = getattr(issue.fields, beta_field_id)
 
-            issue = jira_service.issue(id=issue_id)
+            beta_flag = bool(beta_attr and beta_attr.value == "Beta")
+
+            if beta_flag and not include_beta:
+
+                continue
 
             if product_category_mode == 'components':
 
@@ -95,27 +270,13 @@ def get_roadmap_issues(
 
                 issue.fields.description = ''
 
-            beta_attr = getattr(issue.fields, beta_attribute_name)
-
-            if include_beta and beta_attr and beta_attr.value == "Beta":
-
-                beta_flag = True
-            
-            elif not include_beta and beta_attr.value == "Beta":
-            
-                continue
-
-            else: 
-
-                beta_flag = False
-
             roadmap_issues.append(JiraRoadmapIssue(
                 summary=issue.fields.summary,
                 description=issue.fields.description,
-                jira_id=issue_id.id,
+                jira_id=issue.id,
                 product_categories=filtered_categories,
                 jira_quarter=issue.fields.status.name,
-                jira_link=issue.permalink(),
+                jira_link=browse_url + issue.key,
                 beta = beta_flag
             ))
             
@@ -125,6 +286,28 @@ def get_roadmap_issues(
 
         raise Exception("No jira issues were found with the provided JQL Filter")
 
+def _uuid_pool(n=256):
+    '''Generates uuid4 strings for Google Slides object ids, reading the random bytes for n ids at a time'''
+
+    while True:
+
+        buf = os.urandom(16 * n)
+
+        for i in range(n):
+            yield str(uuid.UUID(bytes=buf[i*16:(i+1)*16], version=4))
+
+_pool = _uuid_pool()
+
+# shape property values shared by many requests, built once rather than per shape.
+# They are referenced by every request using them, so don't modify them in place
+_OUTLINE_TRANSPARENT = {"outlineFill": {"solidFill": {"alpha": 0}}}
+_FILL_TRANSPARENT = {"solidFill": {"alpha": 0}}
+
+@lru_cache(maxsize=None)
+def _theme_fill(color):
+    '''Solid fill using one of the presentation's theme colors (e.g. ACCENT1)'''
+    return {"solidFill": {"color": {"themeColor": color}}}
+
 def gen_header_slide_req(title):
     '''Creates a request body for a new slide
 
@@ -136,8 +319,8 @@ def gen_header_slide_req(title):
         (str): Google Slides id of the object created
     '''
 
-    titleId = str(uuid.uuid4())
-    slideId = str(uuid.uuid4())
+    titleId = next(_pool)
+    slideId = next(_pool)
 
     request_body = [
         {
@@ -183,20 +366,20 @@ def gen_roadmap_slide_req(
     roadmap_box_config = roadmap_slide_config['roadmap_box']
     columns_config = roadmap_slide_config['columns']
     
-    title_id = str(uuid.uuid4())
-    slide_id = str(uuid.uuid4())    
-    left_header_element_id = str(uuid.uuid4())
-    left_main_element_id = str(uuid.uuid4())
+    title_id = next(_pool)
+    slide_id = next(_pool)    
+    left_header_element_id = next(_pool)
+    left_main_element_id = next(_pool)
 
     left_main_locx=left_header_config["locx"]
     
     # timeline arrow
     timeline_arrow_start_locx = left_header_config["locx"] + left_header_config["width"]
     timeline_arrow_start_locy = left_header_config["locy"] + left_header_config["height"]/2
-    timeline_arrow_element_id = str(uuid.uuid4())
+    timeline_arrow_element_id = next(_pool)
     
     
-    slide_req = [{
+    request_body = [{
         'createSlide': {
             'objectId':slide_id,
             'slideLayoutReference': {
@@ -211,9 +394,9 @@ def gen_roadmap_slide_req(
         }
     }]
 
-    title_req = [{'insertText': {'objectId': title_id, 'text': title}}]
+    request_body.append({'insertText': {'objectId': title_id, 'text': title}})
     
-    left_main_req = [{
+    request_body.extend(({
             "createShape": {
                 "objectId": left_main_element_id,
                 "shapeType": left_main_config["shape_type"],
@@ -241,8 +424,8 @@ def gen_roadmap_slide_req(
                 "objectId": left_main_element_id,
                 "shapeProperties" : {
                     "contentAlignment": "TOP",
-                    "outline": {"outlineFill": {"solidFill":{"alpha":0}}},
-                    "shapeBackgroundFill":{"solidFill": {"color": {"themeColor":left_main_config["color"]}}}
+                    "outline": _OUTLINE_TRANSPARENT,
+                    "shapeBackgroundFill": _theme_fill(left_main_config["color"])
                 }
             }
         },
@@ -271,9 +454,9 @@ def gen_roadmap_slide_req(
                     "alignment": "START",
                 },
             }
-        }]
+        }))
     
-    left_header_req = [{
+    request_body.extend(({
             "createShape": {
                 "objectId": left_header_element_id,
                 "shapeType": left_header_config["shape_type"],
@@ -301,8 +484,8 @@ def gen_roadmap_slide_req(
                 "objectId": left_header_element_id,
                 "shapeProperties" : {
                     "contentAlignment": "TOP",
-                    "outline": {"outlineFill": {"solidFill":{"alpha":0}}},
-                    "shapeBackgroundFill":{"solidFill": {"color": {"themeColor":left_header_config["color"]}}}
+                    "outline": _OUTLINE_TRANSPARENT,
+                    "shapeBackgroundFill": _theme_fill(left_header_config["color"])
                 }
             }
         },
@@ -334,9 +517,9 @@ def gen_roadmap_slide_req(
                     "alignment": "CENTER",
                 },
             }
-        }]
+        }))
 
-    timeline_arrow_req = [{
+    request_body.extend(({
             "createLine": {
                 "objectId": timeline_arrow_element_id,
                 "lineCategory": 'STRAIGHT',
@@ -362,13 +545,11 @@ def gen_roadmap_slide_req(
                 "objectId": timeline_arrow_element_id,
                 "lineProperties" : {
                     "endArrow": "FILL_ARROW",
-                    "lineFill":{"solidFill": {"color": {"themeColor":timeline_arrow_config["color"]}}},
+                    "lineFill": _theme_fill(timeline_arrow_config["color"]),
                     "weight": {"magnitude": timeline_arrow_config["weight"], "unit": "PT"}
                 }
             }
-        }]
-
-    quarter_marker_reqs = []
+        }))
 
     quarter_width = (timeline_arrow_config["width"] - roadmap_box_config['x_padding']*2) / len(columns_config)
     quarter_locx = timeline_arrow_start_locx + roadmap_box_config['x_padding']
@@ -377,10 +558,10 @@ def gen_roadmap_slide_req(
     
     for col_num, column in enumerate(columns_config):
         
-        quarter_marker_element_id = str(uuid.uuid4())
-        quarter_textbox_element_id = str(uuid.uuid4())
+        quarter_marker_element_id = next(_pool)
+        quarter_textbox_element_id = next(_pool)
     
-        quarter_marker_reqs += [
+        request_body.extend((
             {
                 "createShape": {
                     "objectId": quarter_marker_element_id,
@@ -407,8 +588,8 @@ def gen_roadmap_slide_req(
                         shapeBackgroundFill.solidFill.color.themeColor",
                     "objectId": quarter_marker_element_id,
                     "shapeProperties" : {
-                        "outline": {"outlineFill": {"solidFill":{"alpha":0}}},
-                        "shapeBackgroundFill":{"solidFill": {"color": {"themeColor":quarter_marker_config["color"]}}}
+                        "outline": _OUTLINE_TRANSPARENT,
+                        "shapeBackgroundFill": _theme_fill(quarter_marker_config["color"])
                     }
                 }
             },
@@ -438,8 +619,8 @@ def gen_roadmap_slide_req(
                         shapeBackgroundFill.solidFill.alpha",
                     "objectId": quarter_textbox_element_id,
                     "shapeProperties" : {
-                        "outline": {"outlineFill": {"solidFill":{"alpha":0}}},
-                        "shapeBackgroundFill":{"solidFill":{"alpha":0}}
+                        "outline": _OUTLINE_TRANSPARENT,
+                        "shapeBackgroundFill": _FILL_TRANSPARENT
                     }
                 }
             },
@@ -462,9 +643,7 @@ def gen_roadmap_slide_req(
                     }
                 }
             }                
-        ]
-    
-    request_body = slide_req + title_req + left_main_req + left_header_req + timeline_arrow_req + quarter_marker_reqs
+        ))
     
     return request_body, slide_id
 
@@ -493,7 +672,7 @@ def gen_roadmap_item_req(page_id, width, locx, locy, roadmap_box_config, tagline
     ptHeight = {"magnitude": roadmap_box_config["height"], "unit": "PT"}
     ptWidth = {"magnitude": width, "unit": "PT"}
 
-    element_id = str(uuid.uuid4())
+    element_id = next(_pool)
     
     request_body = [
         {
@@ -522,9 +701,9 @@ def gen_roadmap_item_req(page_id, width, locx, locy, roadmap_box_config, tagline
                 "objectId": element_id,
                 "shapeProperties" : {
                     "contentAlignment": "TOP",
-                    "outline": {"outlineFill": {"solidFill": {"color": {"themeColor":roadmap_box_config["outline_color"]}}}},
+                    "outline": {"outlineFill": _theme_fill(roadmap_box_config["outline_color"])},
                     "link": {"url": link},
-                    "shapeBackgroundFill":{"solidFill": {"color": {"themeColor":roadmap_box_config["fill_color"]}}}
+                    "shapeBackgroundFill": _theme_fill(roadmap_box_config["fill_color"])
                 }
             }
         },
@@ -536,25 +715,30 @@ def gen_roadmap_item_req(page_id, width, locx, locy, roadmap_box_config, tagline
             }
         },
         {
-            "updateTextStyle" : {
-                "fields": "bold, fontFamily, fontSize.magnitude, fontSize.unit",
+            "updateParagraphStyle" : {
+                "fields": "alignment",
                 "objectId": element_id,
                 "style" : {
-                    "fontFamily": "Manrope",
-                    "fontSize": {"magnitude": roadmap_box_config["font_size"], "unit":"PT"}
+                    "alignment": "START",
                 },
             }
         },
         {
-            "updateParagraphStyle" : {
-                "fields": "alignment",
+            "updateTextStyle" : {
+                "fields": "bold, fontFamily, fontSize.magnitude, fontSize.unit",
                 "objectId": element_id,
                 "style" : {
-                    "alignment": "START",
+                    "fontFamily": "Manrope",
+                    "fontSize": {"magnitude": roadmap_box_config["font_size"], "unit":"PT"}
                 },
             }
-        },
-        {
+        }
+    ]
+
+    # an empty range can't be bolded, so only send the update when there's a tagline
+    if tagline:
+
+        request_body.append({
             "updateTextStyle" : {
                 "fields": "bold",
                 "objectId": element_id,
@@ -563,12 +747,11 @@ def gen_roadmap_item_req(page_id, width, locx, locy, roadmap_box_config, tagline
                 },
                 "textRange": {"endIndex": len(tagline), "startIndex": 0, "type": "FIXED_RANGE"}
             }
-        }
-    ]
+        })
 
     if beta: 
 
-        beta_flag_element_id = str(uuid.uuid4())
+        beta_flag_element_id = next(_pool)
 
         beta_flag_req_body = [
             {
@@ -599,8 +782,8 @@ def gen_roadmap_item_req(page_id, width, locx, locy, roadmap_box_config, tagline
                     "objectId": beta_flag_element_id,
                     "shapeProperties" : {
                         "contentAlignment": "MIDDLE",
-                        "outline": {"outlineFill": {"solidFill": {"color": {"themeColor":roadmap_box_config["beta_label_outline_color"]}}}},
-                        "shapeBackgroundFill":{"solidFill": {"color": {"themeColor":roadmap_box_config["beta_label_color"]}}}
+                        "outline": {"outlineFill": _theme_fill(roadmap_box_config["beta_label_outline_color"])},
+                        "shapeBackgroundFill": _theme_fill(roadmap_box_config["beta_label_color"])
                     }
                 }
             },
@@ -639,30 +822,23 @@ def gen_roadmap_item_req(page_id, width, locx, locy, roadmap_box_config, tagline
 
 def get_unique_product_groups(roadmap_issues):
 
-    categories = []
-    
-    for issue in roadmap_issues:
-
-        categories += issue.product_categories
+    return list({category for issue in roadmap_issues for category in issue.product_categories})
 
-    return list(set(categories))
-
-@dataclass
+@dataclass(slots=True)
 class RoadmapSlide:
     title:str
     google_slide_id:str
     product_category:str
 
-def generate_roadmap_slides(presentation_id, slides_service, product_categories, roadmap_slide_config):
-    '''Creates the section headers and placeholder roadmap slides to populate with roadmap items
+def generate_roadmap_slides(product_categories, roadmap_slide_config):
+    '''Creates the requests for the section headers and placeholder roadmap slides to populate with roadmap items
 
     Args:
-        presentation_id (str): google id of presentation to add slides to
-        slides_service (): google authenticated service to use when creating slides
         product_categories (list(str)): list of unique product categories
         roadmap_slide_config (dict): all of the properties required to create the roadmap slides
 
     Returns:
+        (list(dict)): request body to generate the slides
         (list(RoadmapSlides)): slides generated 
     '''
     
@@ -688,32 +864,22 @@ def generate_roadmap_slides(presentation_id, slides_service, product_categories,
         
         slide_reqs += roadmap_slide_req
 
-    res = updateSlides(
-        service = slides_service,
-        presentationId = presentation_id,
-        body = {'requests': slide_reqs}
-    )
-
-    return slides
+    return slide_reqs, slides
 
 def populate_roadmap_with_issues(
-    presentation_id, 
-    slides_service, 
     roadmap_slides, 
     roadmap_slide_config,
     jira_roadmap_issues
 ):
-    '''Places the roadmap items on the slides provided based on the config
+    '''Generates the requests placing the roadmap items on the slides provided based on the config
 
     Args:
-        presentation_id (str): google id of presentation to add slides to
-        slides_service (): google authenticated service to use when creating slides
         roadmap_slides (list(Slide)): slides for placing the roadmap items on
         roadmap_slide_config (dict): configuraiton for the roadmap slides
         jira_roadmap_issues (list(JiraRoadmapIssues)): list of roadmap issues to add to the slides
 
-    Returns: 
-        (list): updates made to the slides
+    Yields: 
+        (dict): request body to generate the roadmap items, one request at a time
     '''
 
     roadmap_box_config = roadmap_slide_config['roadmap_box']
@@ -726,46 +892,50 @@ def populate_roadmap_with_issues(
     roadmap_box_locx = left_header_config['locx'] + left_header_config['width'] + roadmap_box_config['x_padding']
     roadmap_box_locy = left_header_config['locy'] + left_header_config['height']
     
-    roadmap_shapes = []
+    # index the issues by category and the columns by status up front so each slide
+    # only visits its own issues
+    category_issues = defaultdict(list)
+
+    for issue in jira_roadmap_issues:
+
+        for category in set(issue.product_categories):
+            category_issues[category].append(issue)
+
+    status_columns = defaultdict(list)
+
+    for col_num, col in enumerate(columns_config):
+
+        for status in set(col['jira_statuses']):
+            status_columns[status].append((col_num, col))
 
     for slide in roadmap_slides:
 
         for col in columns_config:
             col['count'] = 0
     
-        for issue in jira_roadmap_issues:
-    
-            if slide.product_category in issue.product_categories:
+        for issue in category_issues[slide.product_category]:
 
-                for col_num, col in enumerate(columns_config):
-                    
-                    if issue.jira_quarter in col['jira_statuses']:
+            for col_num, col in status_columns[issue.jira_quarter]:
 
-                        locx = roadmap_box_locx + (roadmap_box_width + roadmap_box_config["x_padding"]) * col_num
+                locx = roadmap_box_locx + (roadmap_box_width + roadmap_box_config["x_padding"]) * col_num
 
-                        locy = col['count'] * (roadmap_box_config["height"] + roadmap_box_config["y_padding"]) + roadmap_box_locy
+                locy = col['count'] * (roadmap_box_config["height"] + roadmap_box_config["y_padding"]) + roadmap_box_locy
 
-                        col['count'] += 1
+                col['count'] += 1
 
-                        roadmap_shape, shape_id = gen_roadmap_item_req(
-                            page_id=slide.google_slide_id,
-                            tagline=issue.summary,
-                            description=issue.description[:roadmap_box_config["description_length"]],
-                            width=roadmap_box_width,
-                            locx=locx,
-                            locy=locy,
-                            link=issue.jira_link,
-                            roadmap_box_config=roadmap_box_config,
-                            beta = issue.beta
-                        )
-                
-                        roadmap_shapes.append(roadmap_shape)
-    
-    return updateSlides(
-        service = slides_service,
-        presentationId = presentation_id,
-        body = {'requests': roadmap_shapes}
-    )
+                roadmap_shape, shape_id = gen_roadmap_item_req(
+                    page_id=slide.google_slide_id,
+                    tagline=issue.summary,
+                    description=issue.description[:roadmap_box_config["description_length"]],
+                    width=roadmap_box_width,
+                    locx=locx,
+                    locy=locy,
+                    link=issue.jira_link,
+                    roadmap_box_config=roadmap_box_config,
+                    beta = issue.beta
+                )
+                    
+                yield from roadmap_shape
 
 def generate_roadmap_deck(jira_service, google_service, roadmap_slide_config, presentation_id):
     '''Get the jira roadmap issues and generate all of the slides with the details
@@ -784,19 +954,23 @@ def generate_roadmap_deck(jira_service, google_service, roadmap_slide_config, pr
     
     product_categories = get_unique_product_groups(jira_roadmap_issues)
     
-    slides = generate_roadmap_slides(
-        slides_service=google_service, 
-        presentation_id=presentation_id, 
+    slide_reqs, slides = generate_roadmap_slides(
         product_categories=product_categories,
         roadmap_slide_config=roadmap_slide_config
     )
     
-    res_populate_roadmap = populate_roadmap_with_issues(
-        presentation_id=presentation_id,
-        slides_service=google_service,
+    item_reqs_iter = populate_roadmap_with_issues(
         roadmap_slides=slides, 
         roadmap_slide_config=roadmap_slide_config,
         jira_roadmap_issues=jira_roadmap_issues
     )
 
+    # the items reference the slide ids created above, so they have to follow
+    # the slide requests
+    res = batched_update(
+        service = google_service,
+        presentation_id = presentation_id,
+        requests = chain(slide_reqs, item_reqs_iter)
+    )
+
     return f"Generated {len(slides)*2} slides, {len(product_categories)} product categories, and {len(jira_roadmap_issues)} roadmap items."
\ No newline at end of file